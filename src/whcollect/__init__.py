@@ -1,20 +1,7 @@
-from pathlib import Path
+from importlib.metadata import PackageNotFoundError, version
 
-import tomli
-
-
-def version_from_pyproject_toml() -> str:
-    """Extract the program version from pyproject.toml in the root directory."""
-    version = "n/a"
-    project_root = Path(__file__).parent.parent.parent
-    if (pyproject_toml := project_root / "pyproject.toml").is_file():
-        with pyproject_toml.open("rb") as f:
-            try:
-                toml_dict = tomli.load(f)
-                version = toml_dict["tool"]["poetry"]["version"]
-            except (tomli.TOMLDecodeError, KeyError):
-                pass
-    return version
-
-
-__version__ = version_from_pyproject_toml()
+try:
+    __version__ = version("whcollect")
+except PackageNotFoundError:
+    # Not installed (e.g. running straight from a source checkout).
+    __version__ = "0.0.0+dev"
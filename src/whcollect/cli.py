@@ -1,9 +1,11 @@
+import asyncio
 from pathlib import Path
 from typing import Final
 
 import click
 
 from . import __version__
+from .orchestrator import Orchestrator
 
 # Environment variable to check for the API key.
 API_KEY_ENV_VAR: Final = "WALLHAVEN_API_KEY"
@@ -43,13 +45,27 @@ cli_context_settings = {"help_option_names": ["-h", "--help"]}
     is_flag=True,
     help="Suppress creating per-collection subdirectories",
 )
-def cli(username: str, collections: list[str], api_key: str, destination: Path) -> None:
+def cli(
+    username: str,
+    collections: list[str],
+    api_key: str,
+    destination: Path,
+    flat: bool,
+) -> None:
     """Download wallpapers from your wallhaven collections.
 
     USERNAME refers to your wallhaven username, and COLLECTIONS is a
     space-separated list of collection labels or IDs.
     """
-    print(f"username: <{username}>")
-    print(f"collections: <{collections}>")
-    print(f"api_key: <{api_key}>")
-    print(f"destination: <{destination}>")
+
+    async def main() -> None:
+        async with Orchestrator(
+            username,
+            collections,
+            api_key,
+            save_location=destination,
+            flat=flat,
+        ) as orchestrator:
+            await orchestrator.run()
+
+    asyncio.run(main())
@@ -1,12 +1,36 @@
 import logging
 from pathlib import Path
 
-import aiofiles
-from aiohttp import ClientSession, ClientTimeout
+from aiohttp import ClientError, ClientSession, ClientTimeout
 from yarl import URL
 
+from . import _io
+
 logger = logging.getLogger(__name__)
 
+# Chunk size for streaming downloads to disk (64 KiB, matching typical
+# file-system block sizes).
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+
+async def _already_downloaded(
+    url: URL, full_path: Path, session: ClientSession
+) -> bool:
+    """Check whether an existing file matches the size the server reports.
+
+    This is only an optimization, so it fails open: if the server rejects
+    the HEAD request or reports a bogus Content-Length, the file is
+    re-downloaded rather than the error killing the whole pipeline.
+    """
+    logger.info(f"HEAD {url}")
+    try:
+        async with session.head(url, raise_for_status=True) as resp:
+            expected_size = int(resp.headers.get("Content-Length", 0))
+    except (ClientError, ValueError) as exc:
+        logger.info(f"HEAD {url} failed ({exc!r}); downloading anyway")
+        return False
+    return expected_size > 0 and full_path.stat().st_size == expected_size
+
 
 async def download_wallpaper(
     url: URL | str,
@@ -19,6 +43,10 @@ async def download_wallpaper(
 
     If a session is provided, it will be reused; otherwise a new session will be
     created with the specified/default timeout.
+
+    If the destination file already exists with the size the server reports,
+    the download is skipped, so re-runs only cost a HEAD request per
+    wallpaper instead of a full download.
     """
     # Normalize the required arguments.
     url = URL(url)
@@ -32,13 +60,19 @@ async def download_wallpaper(
         session = ClientSession(timeout=timeout)
         close_session = True
 
+    file_name = url.name
+    full_path = location / file_name
+
+    if full_path.is_file() and await _already_downloaded(url, full_path, session):
+        logger.info(f"Skipping {file_name}: already saved at {full_path}")
+        if close_session:
+            await session.close()
+        return full_path
+
     logger.info(f"GET {url}")
     async with session.get(url, raise_for_status=True) as resp:
-        file_name = url.path.split("/")[-1]
-        full_path = location / file_name
-        async with aiofiles.open(full_path, "wb") as f:
-            await f.write(await resp.read())
-            logger.info(f"Saved {file_name} to {full_path}")
+        await _io.write_file(full_path, resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE))
+        logger.info(f"Saved {file_name} to {full_path}")
 
     # Close the session only if it was just created.
     if close_session:
@@ -7,9 +7,17 @@ class BadResponse(Exception):
     from the requests.
 
     The latter is stored in the exception instance to prevent printing its trace-
-    back in case this exception goes unhandled.
+    back in case this exception goes unhandled. The status code of the last
+    response received (if any) is stored alongside it, since the response body
+    itself may already have been released by the time this is raised.
     """
 
-    def __init__(self, *args, last_exception_caught: Exception | None = None):
+    def __init__(
+        self,
+        *args,
+        last_exception_caught: Exception | None = None,
+        last_response_status: int | None = None,
+    ):
         super().__init__(*args)
         self.last_exception_caught = last_exception_caught
+        self.last_response_status = last_response_status
@@ -1,12 +1,13 @@
 import asyncio
-import atexit
 import logging
-from asyncio import AbstractEventLoop, Queue, Task
+from asyncio import Queue
 from collections.abc import Iterable
 from pathlib import Path
+from types import TracebackType
 from typing import Any, ClassVar
 
-from aiohttp import ClientSession, ClientTimeout
+import orjson
+from aiohttp import AsyncResolver, ClientSession, ClientTimeout, TCPConnector
 from yarl import URL
 
 from .downloader import download_wallpaper
@@ -14,13 +15,17 @@ from .requests import request_with_backoff
 
 logger = logging.getLogger(__name__)
 
-# Type alias for an asyncio-compatible event loop.
-EventLoop = AbstractEventLoop
-
 
 class Orchestrator:
     """Orchestrator to manage the downloading and saving of wallpapers.
 
+    Intended to be used as an async context manager, which takes care of
+    creating and closing the HTTP client session:
+    ```
+    async with Orchestrator(username, collections, api_key) as orchestrator:
+        await orchestrator.run()
+    ```
+
     Attributes:
         API_BASE_URL: Wallhaven API URL.
         DEFAULT_REQUEST_TIMEOUT: Self-explanatory.
@@ -44,10 +49,10 @@ class Orchestrator:
     save_location: Path
     create_dirs: bool
     url_params: dict[str, str]
-    _loop: EventLoop
-    _session: ClientSession
+    _session: ClientSession | None
+    _owns_session: bool
     _valid_collections: set[tuple[str, str]]
-    _download_queue: Queue[tuple[URL | str, Path | str]]
+    _download_queue: Queue[tuple[URL | str, Path | str] | None]
 
     def __init__(
         self,
@@ -57,7 +62,6 @@ class Orchestrator:
         save_location: Path | str | None = None,
         flat: bool = False,
         *,
-        loop: EventLoop | None = None,
         session: ClientSession | None = None,
         **extra_params,
     ):
@@ -65,41 +69,54 @@ class Orchestrator:
         self.collections = set(collections)
         self.api_key = api_key
 
+        # Resolve the base path once here; everything downstream joins onto
+        # an already-absolute, normalized path.
         if save_location is None:
             self.save_location = Path.cwd()
         else:
-            self.save_location = Path(save_location)
+            self.save_location = Path(save_location).resolve()
             if not self.save_location.is_dir():
                 raise NotADirectoryError(f"Directory must exist: {self.save_location}")
         self.create_dirs = not flat
 
-        # Set the asyncio event loop up.
-        if loop is None:
-            self._loop = asyncio.new_event_loop()
-            atexit.register(self._close_loop)
-        else:
-            if not isinstance(loop, AbstractEventLoop):
-                raise TypeError("'loop' must be an asyncio-compatible event loop")
-            self._loop = loop
-
-        # Set the HTTP client session up.
-        if session is None:
-            self._session = self._loop.run_until_complete(self._create_client_session())
-            # The registered functions are invoked in the reverse order, so `_close_session`
-            # must be registered after `_close_loop` if both are registered.
-            atexit.register(self._close_session)
-        else:
-            if not isinstance(session, ClientSession):
-                raise TypeError(
-                    "'session' must be an instance of aiohttp.ClientSession"
-                )
-            self._session = session
+        if session is not None and not isinstance(session, ClientSession):
+            raise TypeError("'session' must be an instance of aiohttp.ClientSession")
+        self._session = session
+        self._owns_session = session is None
 
         self.url_params = extra_params
 
+    async def __aenter__(self) -> "Orchestrator":
+        if self._session is None:
+            self._session = await self._create_client_session()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        # Only close the session if it was created here; an injected
+        # session belongs to the caller.
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+
     async def _create_client_session(self) -> ClientSession:
         """Create the default HTTP client session to use for requests."""
+        # Keep connections to wallhaven alive and pooled so the workers
+        # don't pay a TCP+TLS handshake per wallpaper, and resolve DNS
+        # once for the life of the (short-lived) process.
+        connector = TCPConnector(
+            limit=self.DEFAULT_MAX_DOWNLOAD_WORKERS * 2,
+            limit_per_host=self.DEFAULT_MAX_DOWNLOAD_WORKERS,
+            resolver=AsyncResolver(),
+            use_dns_cache=True,
+            ttl_dns_cache=3600,
+            keepalive_timeout=60,
+        )
         session = ClientSession(
+            connector=connector,
             headers={"X-API-Key": self.api_key},
             timeout=ClientTimeout(self.DEFAULT_REQUEST_TIMEOUT),
             raise_for_status=True,
@@ -108,28 +125,28 @@ class Orchestrator:
 
     @property
     def session(self) -> ClientSession:
+        if self._session is None:
+            raise RuntimeError(
+                "No client session; use the orchestrator as an async context "
+                "manager or pass a session in"
+            )
         return self._session
 
-    @property
-    def loop(self) -> EventLoop:
-        return self._loop
-
     async def fetch_and_normalize_collections(self) -> set[tuple[str, str]]:
         """Fetch and validate collection IDs."""
         url = self.API_BASE_URL / "collections" / self.username
         logger.info(f"GET {url}")
         async with self.session.get(url) as resp:
-            obj: dict = await resp.json()
+            obj: dict = await resp.json(loads=orjson.loads)
 
         if error := obj.get("error"):
             raise ValueError(f"Error: {error}")
 
-        self._valid_collections = set()
-        for item in obj["data"]:  # type: dict[str, Any]
-            label = item["label"]
-            id_ = str(item["id"])
-            if label in self.collections or id_ in self.collections:
-                self._valid_collections.add((id_, label))
+        self._valid_collections = {
+            (str(item["id"]), item["label"])
+            for item in obj["data"]  # type: dict[str, Any]
+            if item["label"] in self.collections or str(item["id"]) in self.collections
+        }
 
         logger.info(f"Validated collections: {self._valid_collections}")
         return self._valid_collections
@@ -143,40 +160,79 @@ class Orchestrator:
 
         return self.save_location
 
-    async def fetch_and_queue_wallpapers_for_downloading(self) -> None:
-        """Fetch wallpapers and queue downloads."""
-        base_url = self.API_BASE_URL / "collections" / self.username
-
-        self._download_queue = Queue()
-
-        for collection_id, collection_label in self._valid_collections:
-            url = base_url / collection_id
-            save_location = self.construct_wallpaper_destination(collection_label)
-            params = self.url_params.copy()
-            page = 1
-
-            while True:
-                params["page"] = str(page)
-
-                logger.info(f"GET {url}{f' (params: {params})' if params else ''}")
-                resp = await request_with_backoff(
-                    self.session, "GET", url, params=params
-                )
-                async with resp:
-                    obj: dict = await resp.json()
+    async def _fetch_page(self, url: URL) -> dict:
+        """Fetch a single listing page and return its parsed JSON payload."""
+        logger.info(f"GET {url}")
+        resp = await request_with_backoff(self.session, "GET", url)
+        async with resp:
+            obj: dict = await resp.json(loads=orjson.loads)
 
-                if error := obj.get("error"):
-                    raise ValueError(f"Error: {error}")
+        if error := obj.get("error"):
+            raise ValueError(f"Error: {error}")
 
-                for item in obj["data"]:  # type: dict[str, Any]
-                    queue_item = (item["path"], save_location)
-                    await self._download_queue.put(queue_item)
-                    logger.info(f"Added to download queue: {queue_item}")
+        return obj
 
-                if page >= obj["meta"]["last_page"]:
-                    break
+    async def _queue_page_items(self, obj: dict, save_location: Path) -> None:
+        """Queue the wallpapers listed on a single page for downloading."""
+        for item in obj["data"]:  # type: dict[str, Any]
+            queue_item = (item["path"], save_location)
+            await self._download_queue.put(queue_item)
+            logger.info(f"Added to download queue: {queue_item}")
+
+    async def _enqueue_collection(
+        self, collection_id: str, save_location: Path
+    ) -> None:
+        """Fetch one collection's listing and queue its wallpapers."""
+        url = self.API_BASE_URL / "collections" / self.username / collection_id
+
+        # Bake the query into the URL once per page; yarl builds the query
+        # string directly instead of aiohttp re-encoding a params dict on
+        # every request (and retry).
+        url = url.update_query(self.url_params)
+
+        # The first page tells us how many pages there are; fetch the
+        # rest concurrently instead of walking them one RTT at a time.
+        # The task group guarantees that if one page fetch fails, the
+        # in-flight fetches for the later pages are cancelled and awaited
+        # rather than leaked.
+        first_page = await self._fetch_page(url.update_query(page="1"))
+        last_page: int = first_page["meta"]["last_page"]
+        async with asyncio.TaskGroup() as tg:
+            page_tasks = [
+                tg.create_task(self._fetch_page(url.update_query(page=str(page))))
+                for page in range(2, last_page + 1)
+            ]
+
+            await self._queue_page_items(first_page, save_location)
+            for task in page_tasks:
+                await self._queue_page_items(await task, save_location)
+
+    async def fetch_and_queue_wallpapers_for_downloading(
+        self, *, num_workers: int
+    ) -> None:
+        """Fetch wallpapers and queue downloads.
+
+        All collections are listed concurrently; the shared session's
+        connector caps how many requests are actually in flight. After the
+        last wallpaper has been queued, one `None` sentinel per worker is
+        queued to signal that no more items are coming.
+        """
+        # Create the destination directories up front: mkdir is a blocking
+        # syscall, so keep it out of the async listing path.
+        save_locations = {
+            collection_id: self.construct_wallpaper_destination(collection_label)
+            for collection_id, collection_label in self._valid_collections
+        }
+
+        await asyncio.gather(
+            *(
+                self._enqueue_collection(collection_id, save_location)
+                for collection_id, save_location in save_locations.items()
+            )
+        )
 
-                page += 1
+        for _ in range(num_workers):
+            await self._download_queue.put(None)
 
         logger.info("Finished queueing wallpapers for downloading")
 
@@ -186,28 +242,34 @@ class Orchestrator:
         async def worker(name: str) -> None:
             while True:
                 downloader_args = await self._download_queue.get()
+                if downloader_args is None:
+                    logger.info(f"Worker<{name}>: Received shutdown sentinel")
+                    return
                 logger.info(f"Worker<{name}>: Gotten from queue: {downloader_args}")
-                await download_wallpaper(*downloader_args)
+                await download_wallpaper(*downloader_args, session=self.session)
                 self._download_queue.task_done()
 
-        tasks: list[Task] = []
         max_workers = max_workers or self.DEFAULT_MAX_DOWNLOAD_WORKERS
-        for i in range(max_workers):
-            tasks.append(asyncio.create_task(worker(name=f"#{i+1}")))
+        async with asyncio.TaskGroup() as tg:
+            for i in range(max_workers):
+                tg.create_task(worker(name=f"#{i+1}"))
 
-        await self._download_queue.join()
         logger.info("All download queue items have been processed")
 
-        for task in tasks:
-            task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
+    async def run(self, *, max_workers: int | None = None) -> None:
+        """Run the listing and downloading phases as one pipeline.
 
-    def _close_session(self) -> None:
-        """Cleanup function for atexit to close the HTTP client session."""
-        if not self._session.closed:
-            self._loop.run_until_complete(self._session.close())
+        The producer and the worker pool run concurrently, so downloads
+        start as soon as the first page of wallpapers has been listed. The
+        bounded queue keeps the producer from racing arbitrarily far ahead
+        of the workers.
+        """
+        max_workers = max_workers or self.DEFAULT_MAX_DOWNLOAD_WORKERS
+
+        await self.fetch_and_normalize_collections()
 
-    def _close_loop(self) -> None:
-        """Cleanup function for atexit to close the event loop."""
-        if self._loop.is_running():
-            self._loop.close()
+        self._download_queue = Queue(maxsize=2 * max_workers)
+        await asyncio.gather(
+            self.fetch_and_queue_wallpapers_for_downloading(num_workers=max_workers),
+            self.download_wallpapers(max_workers=max_workers),
+        )
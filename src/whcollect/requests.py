@@ -1,9 +1,24 @@
 import asyncio
 import logging
-from collections.abc import Iterable
-from typing import Literal
+import random
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Literal, NamedTuple
+from weakref import WeakKeyDictionary
 
-from aiohttp import ClientResponse, ClientResponseError, ClientSession
+from aiohttp import (
+    ClientConnectorError,
+    ClientOSError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    ServerDisconnectedError,
+    TCPConnector,
+)
 from yarl import URL
 
 from .exceptions import BadResponse
@@ -11,12 +26,493 @@ from .exceptions import BadResponse
 logger = logging.getLogger(__name__)
 
 # Literal type for supported HTTP methods.
-HTTP_METHOD = Literal["GET"]
+HTTP_METHOD = Literal["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "POST"]
 
-# Default max times to try a request (eight tries means 127 seconds between the
-# first and last requests).
+# Methods that are safe to retry (and hedge) because repeating them cannot
+# change the outcome.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Default max times to try a request (eight tries means up to 127 seconds
+# between the first and last requests).
 DEFAULT_MAX_TRIES = 8
 
+# Statuses retried by default: rate limiting, timeouts, and transient server
+# errors. Other 4xx statuses stay non-retryable so real bugs aren't masked.
+DEFAULT_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Connection-level failures that are worth retrying, e.g. resets and
+# dropped keepalive connections.
+RETRYABLE_CONNECTION_ERRORS = (
+    ClientConnectorError,
+    ServerDisconnectedError,
+    ClientOSError,
+    asyncio.TimeoutError,
+)
+
+# Base delay and cap (both in seconds) for the exponential backoff.
+BACKOFF_BASE = 1
+BACKOFF_CAP = 60
+
+# Precomputed backoff ceilings (BACKOFF_BASE * 2**n, capped), so the retry
+# path indexes a tuple instead of exponentiating per attempt.
+_BACKOFF: tuple[int, ...] = tuple(
+    min(BACKOFF_BASE << n, BACKOFF_CAP) for n in range(32)
+)
+
+# Cap on concurrently hedged requests, so hedging disables itself instead of
+# amplifying load when many requests are already slow.
+MAX_INFLIGHT_HEDGES = 8
+
+# Default per-host concurrency for the bulkhead below. Keep it smaller than
+# the connector's limit_per_host so one host's retries can never starve the
+# connection pool for everyone else.
+DEFAULT_PER_HOST_LIMIT = 8
+
+# Count of hedged (duplicated) requests currently in flight.
+_inflight_hedges = 0
+
+
+class RetryEvent(NamedTuple):
+    """One step of a `request_with_backoff` call, for instrumentation.
+
+    `attempt` is 0 for the event emitted before the first attempt;
+    `delay` is the backoff sleep about to follow a retryable failure (0
+    otherwise).
+    """
+
+    host: str
+    attempt: int
+    status: int | None
+    exc_type: type | None
+    delay: float
+
+
+class CounterHook:
+    """A ready-made `on_event` hook counting retry events per host.
+
+    The per-host counts give a supervisor enough signal to adapt retry
+    policy (tighten budgets, pre-trip breakers) without touching the
+    request path itself.
+    """
+
+    def __init__(self):
+        self.counts: Counter[str] = Counter()
+
+    def __call__(self, event: RetryEvent) -> None:
+        self.counts[event.host] += 1
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker to fail fast during prolonged outages.
+
+    After `failure_threshold` consecutive retryable failures against a host,
+    the circuit opens and further requests to it fail immediately instead of
+    burning through the full backoff schedule. After `reset_timeout` seconds
+    the circuit goes half-open: one probe request is let through, and its
+    outcome decides whether the circuit closes again or re-opens.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+
+    def allow(self, host: str) -> bool:
+        """Check whether a request to the host may proceed."""
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return True
+        if time.monotonic() - opened_at >= self.reset_timeout:
+            # Half-open: allow one probe, but leave the host one failure
+            # away from the threshold so a failed probe re-opens at once.
+            del self._opened_at[host]
+            self._failures[host] = self.failure_threshold - 1
+            return True
+        return False
+
+    def record_failure(self, host: str) -> None:
+        """Count a retryable failure, opening the circuit at the threshold."""
+        failures = self._failures.get(host, 0) + 1
+        self._failures[host] = failures
+        if failures >= self.failure_threshold:
+            logger.info(f"Circuit opened for host: {host}")
+            self._opened_at[host] = time.monotonic()
+
+    def record_success(self, host: str) -> None:
+        """Reset the host's failure count after a successful request."""
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+
+
+class RetryBudget:
+    """Token bucket capping total retries to a fraction of successes.
+
+    Every retry costs one token and every successful request deposits
+    `ratio` tokens, so sustained retries are limited to roughly `ratio`
+    retries per success. The bucket starts with (and is capped at)
+    `min_tokens`, which bounds the initial burst. Prevents a partial outage
+    from turning N concurrent callers into N * max_tries requests against
+    an already-struggling host.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_tokens: int = 10):
+        self.ratio = ratio
+        self.min_tokens = min_tokens
+        self._tokens = float(min_tokens)
+
+    def try_acquire(self) -> bool:
+        """Take a token for one retry, or report that the budget is spent."""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def deposit(self) -> None:
+        """Credit the budget after a successful request."""
+        self._tokens = min(self._tokens + self.ratio, float(self.min_tokens))
+
+
+# Process-wide retry budget shared by all callers by default.
+_default_budget = RetryBudget()
+
+# One semaphore per destination host (the bulkhead pattern), so each host is
+# its own failure domain for in-flight requests. Scoped per client session
+# (like the breakers below) because the semaphores bind to the event loop
+# they were created under; a process-wide map would break the second
+# asyncio.run in a process.
+_session_bulkheads: WeakKeyDictionary[ClientSession, dict[str, asyncio.Semaphore]] = (
+    WeakKeyDictionary()
+)
+
+# Breakers scoped per client session (weakly, so a closed session's breaker
+# state doesn't outlive it).
+_session_breakers: WeakKeyDictionary[ClientSession, CircuitBreaker] = (
+    WeakKeyDictionary()
+)
+
+
+def _retry_after_seconds(headers: Mapping[str, str] | None) -> float:
+    """Parse a Retry-After header into seconds, returning 0 if absent/invalid.
+
+    Both the delta-seconds and the HTTP-date forms are supported.
+    """
+    if headers is None or (value := headers.get("Retry-After")) is None:
+        return 0.0
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if retry_at.tzinfo is None:
+        # A "-0000" (unknown offset) or zoneless date parses naive; assume
+        # UTC rather than crash on aware-minus-naive subtraction.
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+async def _backoff_wait(delay: float) -> None:
+    """Wait out a backoff delay with less overhead than asyncio.sleep.
+
+    A non-positive delay (e.g. `Retry-After: 0`) takes asyncio.sleep's
+    documented zero fast path, which just yields control once. Otherwise a
+    bare timer callback resolves a future, skipping the extra Task wakeup
+    machinery asyncio.sleep sets up per call.
+    """
+    if delay <= 0:
+        await asyncio.sleep(0)
+        return
+
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    handle = loop.call_later(delay, fut.set_result, None)
+    try:
+        await fut
+    finally:
+        # Don't leave a dangling timer if the wait is cancelled.
+        handle.cancel()
+
+
+async def _settle_hedge(
+    done: "set[asyncio.Task[ClientResponse]]",
+) -> ClientResponse:
+    """Pick the winner among the finished tasks of a hedge race.
+
+    If both requests finished in the same tick, a successful task is
+    preferred over a failed one, and the losing body is released so its
+    connection goes back to the pool.
+    """
+    winner = None
+    for task in done:
+        if winner is None and task.exception() is None:
+            winner = task
+    if winner is None:
+        winner = done.pop()
+    for task in done:
+        if task is not winner and task.exception() is None:
+            await task.result().release()
+    return winner.result()
+
+
+async def _request_hedged(
+    session: ClientSession,
+    method: str,
+    url: URL | str,
+    hedge_delay: float,
+    **kwargs,
+) -> ClientResponse:
+    """Issue a request, firing a speculative duplicate after `hedge_delay`.
+
+    Whichever request completes first wins; the loser is cancelled (or its
+    body released, if it managed to finish too). If too many hedges are
+    already in flight, the duplicate is skipped entirely.
+    """
+    global _inflight_hedges
+
+    first = asyncio.ensure_future(session.request(method, url, **kwargs))
+    second: "asyncio.Task[ClientResponse] | None" = None
+    try:
+        try:
+            return await asyncio.wait_for(asyncio.shield(first), hedge_delay)
+        except asyncio.TimeoutError:
+            pass
+
+        if _inflight_hedges >= MAX_INFLIGHT_HEDGES:
+            return await first
+
+        _inflight_hedges += 1
+        try:
+            second = asyncio.ensure_future(session.request(method, url, **kwargs))
+            done, pending = await asyncio.wait(
+                {first, second}, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in pending:
+                task.cancel()
+            return await _settle_hedge(done)
+        finally:
+            _inflight_hedges -= 1
+    except asyncio.CancelledError:
+        # The shield above (and asyncio.wait) protect the underlying
+        # requests from the caller's cancellation; cancel them explicitly
+        # so no in-flight request outlives this call.
+        first.cancel()
+        if second is not None:
+            second.cancel()
+        raise
+
+
+class _RetryPlan(NamedTuple):
+    """Everything `request_with_backoff` resolves up front for one call."""
+
+    url: URL
+    host: str
+    max_tries: int
+    retry_statuses: frozenset[int]
+    breaker: CircuitBreaker
+    budget: RetryBudget
+    bulkhead: asyncio.Semaphore
+    hedge_delay: float | None
+    deadline: float | None
+    raise_for_status: bool
+
+
+def _normalize_attempt_timeout(
+    attempt_timeout: float | ClientTimeout | None, kwargs: dict
+) -> None:
+    """Install the per-attempt timeout into the request kwargs, if any."""
+    if attempt_timeout is None:
+        return
+    if not isinstance(attempt_timeout, ClientTimeout):
+        attempt_timeout = ClientTimeout(total=attempt_timeout)
+    kwargs["timeout"] = attempt_timeout
+
+
+def _plan_retries(
+    session: ClientSession,
+    method: str,
+    url: URL | str,
+    kwargs: dict,
+    *,
+    retry_for_statuses: Iterable[int] | None,
+    max_tries: int,
+    total_timeout: float | None,
+    attempt_timeout: float | ClientTimeout | None,
+    breaker: CircuitBreaker | None,
+    hedge_delay: float | None,
+    budget: RetryBudget | None,
+    per_host_limit: int,
+    allow_non_idempotent_retry: bool,
+) -> _RetryPlan:
+    """Resolve the retry knobs for one `request_with_backoff` call.
+
+    Mutates `kwargs` in place: status handling is forced into the retry
+    loop (see the `raise_for_status` notes there) and the per-attempt
+    timeout is installed.
+    """
+    # Handle error statuses in one place (the status checks in the retry
+    # loop) instead of also catching ClientResponseError from a raising
+    # session.
+    raise_for_status = kwargs.pop("raise_for_status", True)
+    kwargs["raise_for_status"] = False
+    _normalize_attempt_timeout(attempt_timeout, kwargs)
+
+    idempotent = method in IDEMPOTENT_METHODS
+    if not idempotent and not allow_non_idempotent_retry:
+        max_tries = 1
+    # Normalize to a frozenset: O(1) membership, and a generator argument
+    # would otherwise be exhausted after the first check.
+    retry_statuses: frozenset[int] = (
+        frozenset(retry_for_statuses)
+        if retry_for_statuses is not None
+        else DEFAULT_RETRY_STATUSES
+    )
+
+    if breaker is None:
+        breaker = _session_breakers.setdefault(session, CircuitBreaker())
+    if budget is None:
+        budget = _default_budget
+
+    # Parse the URL once up front; passing a str through would make aiohttp
+    # re-parse it on every attempt.
+    if isinstance(url, str):
+        url = URL(url)
+    host = url.host or ""
+
+    # Bulkhead: isolate each host's in-flight requests behind its own
+    # semaphore, so a storm against one bad host can't starve the rest.
+    bulkheads = _session_bulkheads.setdefault(session, {})
+    bulkhead = bulkheads.setdefault(host, asyncio.Semaphore(per_host_limit))
+
+    loop = asyncio.get_running_loop()
+    return _RetryPlan(
+        url=url,
+        host=host,
+        max_tries=max_tries,
+        retry_statuses=retry_statuses,
+        breaker=breaker,
+        budget=budget,
+        bulkhead=bulkhead,
+        hedge_delay=hedge_delay if idempotent else None,
+        deadline=(loop.time() + total_timeout if total_timeout is not None else None),
+        raise_for_status=raise_for_status,
+    )
+
+
+async def _attempt_once(
+    session: ClientSession,
+    method: str,
+    url: URL,
+    hedge_delay: float | None,
+    bulkhead: asyncio.Semaphore,
+    kwargs: dict,
+) -> ClientResponse:
+    """Issue one (possibly hedged) attempt under the host's bulkhead."""
+    async with bulkhead:
+        if hedge_delay is not None:
+            return await _request_hedged(session, method, url, hedge_delay, **kwargs)
+        return await session.request(method, url, **kwargs)
+
+
+def _emit(
+    on_event: Callable[[RetryEvent], None] | None,
+    host: str,
+    attempt: int,
+    status: int | None,
+    exc: Exception | None,
+    delay: float = 0.0,
+) -> None:
+    """Call the `on_event` hook, if there is one, with a `RetryEvent`."""
+    if on_event is not None:
+        on_event(
+            RetryEvent(
+                host,
+                attempt,
+                status,
+                type(exc) if exc is not None else None,
+                delay,
+            )
+        )
+
+
+def _give_up(
+    message: str,
+    on_event: Callable[[RetryEvent], None] | None,
+    host: str,
+    attempt: int,
+    status: int | None,
+    exc: Exception | None,
+) -> BadResponse:
+    """Emit the terminal event and build the `BadResponse` to raise."""
+    _emit(on_event, host, attempt, status, exc)
+    return BadResponse(
+        message,
+        last_exception_caught=exc,
+        last_response_status=status,
+    )
+
+
+def _accept(
+    resp: ClientResponse,
+    plan: _RetryPlan,
+    attempt: int,
+    on_event: Callable[[RetryEvent], None] | None,
+) -> ClientResponse:
+    """Book-keeping for a non-retryable response before returning it."""
+    plan.breaker.record_success(plan.host)
+    plan.budget.deposit()
+    _emit(on_event, plan.host, attempt, resp.status, None)
+    if plan.raise_for_status:
+        resp.raise_for_status()
+    return resp
+
+
+def _next_backoff_delay(
+    n: int, retry_after: float, deadline: float | None, loop
+) -> float | None:
+    """Delay to wait after failed try #n+1, or None if no time remains.
+
+    Honors the server's Retry-After if it asks for longer than the
+    jittered backoff would wait, then clamps to the deadline.
+    """
+    delay = max(
+        retry_after,
+        random.uniform(0, _BACKOFF[min(n, len(_BACKOFF) - 1)]),
+    )
+    if deadline is not None:
+        delay = min(delay, deadline - loop.time())
+        if delay <= 0:
+            return None
+    return delay
+
+
+async def _pause_before_retry(
+    plan: _RetryPlan,
+    n: int,
+    retry_after: float,
+    on_event: Callable[[RetryEvent], None] | None,
+    status: int | None,
+    exc: Exception | None,
+    loop,
+) -> None:
+    """Take a retry token and wait out the backoff after failed try #n+1.
+
+    Raises `BadResponse` if the retry budget or the deadline has run out.
+    """
+    if not plan.budget.try_acquire():
+        raise _give_up(
+            "Retry budget exhausted", on_event, plan.host, n + 1, status, exc
+        )
+    delay = _next_backoff_delay(n, retry_after, plan.deadline, loop)
+    if delay is None:
+        raise _give_up("Deadline exceeded", on_event, plan.host, n + 1, status, exc)
+    _emit(on_event, plan.host, n + 1, status, exc, delay)
+    await _backoff_wait(delay)
+
 
 async def request_with_backoff(
     session: ClientSession,
@@ -25,38 +521,188 @@ async def request_with_backoff(
     *,
     retry_for_statuses: Iterable[int] | None = None,
     max_tries: int = DEFAULT_MAX_TRIES,
+    total_timeout: float | None = None,
+    attempt_timeout: float | ClientTimeout | None = None,
+    breaker: CircuitBreaker | None = None,
+    hedge_delay: float | None = None,
+    budget: RetryBudget | None = None,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    allow_non_idempotent_retry: bool = False,
+    on_event: Callable[[RetryEvent], None] | None = None,
     **kwargs,
 ) -> ClientResponse:
-    """Make a request, retrying with exponential backoff if it fails.
+    """Make a request, retrying with jittered exponential backoff if it fails.
+
+    The delay before try #n is drawn uniformly from [0, min(BACKOFF_CAP,
+    BACKOFF_BASE * 2**n)] ("full jitter"), so concurrent callers retrying
+    against the same host spread out instead of hammering it in lockstep.
+
+    `attempt_timeout` bounds each individual attempt (as opposed to the
+    session-wide timeout); an attempt that times out counts as a failure and
+    is retried like a retryable status. `total_timeout` bounds the whole
+    call, attempts and backoff sleeps included: backoff delays are clamped
+    to the remaining time, and `BadResponse` is raised once none is left.
+
+    A per-host circuit breaker (shared across calls on the same session
+    unless one is passed in) short-circuits with `BadResponse` while the
+    host's circuit is open, instead of sleeping through the whole backoff
+    schedule during a prolonged outage.
+
+    If `hedge_delay` is set (typically to the service's p95 latency), an
+    attempt that hasn't completed by then fires a speculative duplicate and
+    the first response to arrive wins, cutting tail latency.
+
+    Retrying and hedging only make sense for idempotent methods; for
+    anything else (POST) a single attempt is made, and a duplicate is never
+    sent, unless `allow_non_idempotent_retry` is set because the caller
+    knows the operation is safe to repeat.
+
+    Retries draw from a process-wide `RetryBudget` (or one passed in), so
+    under a partial outage the aggregate retry volume stays proportional to
+    the success rate instead of multiplying it.
+
+    If `on_event` is given, it is called synchronously with a cheap
+    `RetryEvent` before the first attempt, after every retryable failure,
+    and after the final success or failure, so callers can observe retry
+    behaviour (see `CounterHook`) and adapt.
+
+    Status handling happens here rather than in the session: requests are
+    issued with `raise_for_status=False` regardless of the session default,
+    retryable statuses are retried, and any other error status raises
+    `ClientResponseError` just before the response would be returned. Pass
+    `raise_for_status=False` to get such responses back instead.
 
     Example usage:
     ```
-    async with aiohttp.ClientSession(raise_for_status=True) as session:
+    async with aiohttp.ClientSession() as session:
         response = await request_with_backoff(session, "GET", "example.com")
         async with response:
             obj = await response.text()
     ```
     """
-    if retry_for_statuses is None:
-        retry_for_statuses = [429]
+    plan = _plan_retries(
+        session,
+        method,
+        url,
+        kwargs,
+        retry_for_statuses=retry_for_statuses,
+        max_tries=max_tries,
+        total_timeout=total_timeout,
+        attempt_timeout=attempt_timeout,
+        breaker=breaker,
+        hedge_delay=hedge_delay,
+        budget=budget,
+        per_host_limit=per_host_limit,
+        allow_non_idempotent_retry=allow_non_idempotent_retry,
+    )
+    url, host = plan.url, plan.host
+    breaker, budget = plan.breaker, plan.budget
+    loop = asyncio.get_running_loop()
 
-    # Store the last exception raised while making a request.
+    # Store the last exception raised and the last status received while
+    # making a request.
     last_exc: Exception | None = None
+    last_status: int | None = None
+
+    _emit(on_event, host, 0, last_status, last_exc)
+
+    for n in range(plan.max_tries):
+        if not breaker.allow(host):
+            raise _give_up(
+                f"Circuit open for host: {host}",
+                on_event,
+                host,
+                n,
+                last_status,
+                last_exc,
+            )
 
-    for n in range(max_tries):
         logger.info(f"{method} {url} (try #{n+1})")
+        retry_after = 0.0
+        resp = None
         try:
-            resp = await session.request(method, url, **kwargs)
-            if resp.status not in retry_for_statuses:
+            resp = await _attempt_once(
+                session, method, url, plan.hedge_delay, plan.bulkhead, kwargs
+            )
+            if resp.status not in plan.retry_statuses:
                 logger.info(f"{method} {url} responded with status: {resp.status}")
-                return resp
-        except ClientResponseError as exc:
-            if exc.status not in retry_for_statuses:
-                raise exc
+                return _accept(resp, plan, n + 1, on_event)
+            last_status = resp.status
+            retry_after = _retry_after_seconds(resp.headers)
+            # Release the body so the connection goes back to the pool
+            # right away instead of staying checked out until GC.
+            await resp.release()
+        except asyncio.CancelledError:
+            # Cancellation must win; just make sure an in-flight response
+            # doesn't keep its connection pinned in the pool.
+            if resp is not None:
+                resp.close()
+            raise
+        except RETRYABLE_CONNECTION_ERRORS as exc:
             last_exc = exc
 
-        if n < max_tries:
-            await asyncio.sleep(2 ** n)
+        breaker.record_failure(host)
+
+        if n + 1 == plan.max_tries:
+            break
+
+        await _pause_before_retry(
+            plan, n, retry_after, on_event, last_status, last_exc, loop
+        )
 
     logger.info(f"{method} {url} failed!")
-    raise BadResponse(f"Tried {max_tries} times", last_exception_caught=last_exc)
+    raise _give_up(
+        f"Tried {plan.max_tries} times",
+        on_event,
+        host,
+        plan.max_tries,
+        last_status,
+        last_exc,
+    )
+
+
+def make_session(
+    *,
+    pool_size: int = 100,
+    per_host: int = 30,
+    keepalive_timeout: float = 30.0,
+    total_timeout: float = 30.0,
+    **kwargs,
+) -> ClientSession:
+    """Create a client session with a connector tuned for this retry layer.
+
+    aiohttp's defaults (limit=100 with no per-host cap) let one host soak
+    up the whole pool. Note that retries and hedged duplicates consume pool
+    slots just like first attempts, so keep `per_host` comfortably above
+    the expected request concurrency against a single host.
+    """
+    connector = TCPConnector(
+        limit=pool_size,
+        limit_per_host=per_host,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=300,
+    )
+    return ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(total=total_timeout),
+        raise_for_status=False,
+        **kwargs,
+    )
+
+
+def schedule(
+    session: ClientSession,
+    method: HTTP_METHOD,
+    url: URL | str,
+    **kwargs,
+) -> "asyncio.Task[ClientResponse]":
+    """Schedule request_with_backoff as a task, eagerly where supported.
+
+    On Python 3.12+ the task starts executing synchronously up to its first
+    await, saving one full event-loop iteration per request compared to
+    asyncio.create_task. Must be called from within a running event loop.
+    """
+    coro = request_with_backoff(session, method, url, **kwargs)
+    if sys.version_info >= (3, 12):
+        return asyncio.Task(coro, eager_start=True)
+    return asyncio.create_task(coro)
@@ -0,0 +1,123 @@
+"""Regression tests for the retry behaviour in whcollect.requests."""
+
+import asyncio
+import time
+
+import pytest
+
+import whcollect.requests as requests_module
+from whcollect.exceptions import BadResponse
+from whcollect.requests import CircuitBreaker, RetryBudget, request_with_backoff
+
+
+class FakeResponse:
+    """Just enough of aiohttp.ClientResponse for request_with_backoff."""
+
+    def __init__(self, status: int, headers: dict[str, str] | None = None):
+        self.status = status
+        self.headers = headers or {}
+
+    async def release(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakeSession:
+    """A session whose request() replays a scripted sequence of responses.
+
+    The last response in the script is repeated if more requests are made
+    than were scripted.
+    """
+
+    def __init__(self, responses: list[FakeResponse]):
+        self._responses = list(responses)
+        self.request_count = 0
+
+    async def request(self, method, url, **kwargs) -> FakeResponse:
+        self.request_count += 1
+        if len(self._responses) > 1:
+            return self._responses.pop(0)
+        return self._responses[0]
+
+
+def _isolated_kwargs() -> dict:
+    """Per-test breaker/budget so tests don't share process-wide state."""
+    return {
+        "breaker": CircuitBreaker(failure_threshold=100),
+        "budget": RetryBudget(min_tokens=100),
+    }
+
+
+def test_retry_after_with_unknown_offset_date():
+    """An RFC "-0000" (unknown offset) HTTP-date parses naive; it must be
+    treated as UTC instead of crashing on aware-minus-naive subtraction."""
+    headers = {"Retry-After": "Wed, 21 Oct 2026 07:28:00 -0000"}
+    assert requests_module._retry_after_seconds(headers) >= 0.0
+
+
+def test_no_backoff_sleep_after_terminal_attempt(monkeypatch):
+    """The final failed attempt must not be followed by a backoff sleep.
+
+    With max_tries=3 against a host that always answers 429, there are
+    exactly two retries and therefore exactly two backoff waits; sleeping
+    after the third (terminal) attempt would just delay the BadResponse.
+    """
+    sleeps: list[float] = []
+
+    async def recording_wait(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(requests_module, "_backoff_wait", recording_wait)
+
+    session = FakeSession([FakeResponse(429)])
+    with pytest.raises(BadResponse) as excinfo:
+        asyncio.run(
+            request_with_backoff(
+                session,
+                "GET",
+                "https://example.com/throttled",
+                max_tries=3,
+                **_isolated_kwargs(),
+            )
+        )
+
+    assert session.request_count == 3
+    assert len(sleeps) == 2
+    assert excinfo.value.last_response_status == 429
+
+
+def test_concurrent_retries_sleep_concurrently(monkeypatch):
+    """Backoff waits must not block the event loop.
+
+    Five concurrent calls each eat one 429 with Retry-After: 0.3 before
+    succeeding. If the waits ran on the loop thread (the old time.sleep
+    behaviour), the calls would serialize and take ~1.5s; the asyncio
+    waits overlap them into roughly one delay's worth of wall time.
+    """
+    # Pin the jittered component to zero so Retry-After alone sets the delay.
+    monkeypatch.setattr(requests_module.random, "uniform", lambda a, b: 0.0)
+
+    delay = 0.3
+
+    async def one_call() -> None:
+        session = FakeSession(
+            [FakeResponse(429, {"Retry-After": str(delay)}), FakeResponse(200)]
+        )
+        resp = await request_with_backoff(
+            session, "GET", "https://example.com/w", **_isolated_kwargs()
+        )
+        assert resp.status == 200
+
+    async def run_all() -> None:
+        await asyncio.gather(*(one_call() for _ in range(5)))
+
+    start = time.monotonic()
+    asyncio.run(run_all())
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 3 * delay